@@ -0,0 +1,36 @@
+"""
+Ahead-of-time build of the Pearson kernel.
+
+Compiles algorithms._kernels.pearson_returns, specialized to contiguous float64
+arrays, into a native extension module (algorithms/corr_native*.so), so no JIT
+compilation happens at startup or on the first request.
+
+Build it once per environment (after installing the requirements):
+
+    python3 -m algorithms._corr_aot
+
+algorithms.correlation imports the native module when present and falls back
+to the JIT-compiled kernel otherwise. Only contiguous float64 arrays are
+accepted by the native build. It is compiled without the JIT's fastmath flags,
+so results equal the JIT kernel's up to rounding (last-ulp differences).
+"""
+
+from pathlib import Path
+
+from numba.pycc import CC
+
+from algorithms._kernels import pearson_returns
+
+cc = CC("corr_native")
+cc.output_dir = str(Path(__file__).resolve().parent)
+
+# (correlation, covariance, count, first, last) <- (p1, p2, log_returns)
+cc.export(
+    "pearson_returns",
+    "Tuple((float64, float64, int64, int64, int64))"
+    "(float64[::1], float64[::1], boolean)",
+)(pearson_returns.py_func)
+
+
+if __name__ == "__main__":
+    cc.compile()
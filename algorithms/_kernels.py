@@ -0,0 +1,79 @@
+"""
+Numba-compiled numeric kernels used by the algorithms.
+
+Kernels take contiguous float64 arrays and return plain scalars, so they can be
+called straight from the calculators without any pandas overhead.
+"""
+
+import numpy as np
+from numba import njit
+
+
+# fastmath is limited to the flags that allow the reductions to be vectorized;
+# the full fastmath=True set assumes no NaNs and would drop the NaN checks below
+@njit(cache=True, fastmath={"reassoc", "contract", "arcp"})
+def pearson_returns(p1, p2, log_returns):
+    """
+    Pearson correlation and covariance of the returns of two price series.
+
+    Returns are computed inline, either simple (p[i] / p[i - 1] - 1) or log
+    (log(p[i] / p[i - 1])), and accumulated as the five sums sum(x), sum(y),
+    sum(x^2), sum(y^2), sum(xy) in a single pass; rows where either return is
+    NaN are skipped. The sums are always accumulated in float64, so this JIT
+    kernel also accepts float32 prices without losing precision in the
+    reduction. The ahead-of-time build (algorithms/_corr_aot.py), which
+    algorithms.correlation uses when present, accepts contiguous float64 only.
+
+    For daily data log(1 + r) ~ r, so the correlation of log returns matches
+    that of simple returns to first order.
+
+    Args:
+        p1: Contiguous float64 prices of the first stock (float32: JIT only)
+        p2: Contiguous prices of the second stock, same dtype and aligned with p1
+        log_returns: Use log returns instead of simple returns
+
+    Returns:
+        Tuple (correlation, covariance, count, first, last), where count is the
+        number of valid returns and first/last are the price indices of the
+        first and last valid return (-1 if there are none). Correlation and
+        covariance are NaN when count < 2 or a series has zero variance.
+    """
+    n = p1.shape[0]
+    count = 0
+    first = -1
+    last = -1
+    sx = 0.0
+    sy = 0.0
+    sxx = 0.0
+    syy = 0.0
+    sxy = 0.0
+
+    for i in range(1, n):
+        if log_returns:
+            x = np.log(np.float64(p1[i]) / np.float64(p1[i - 1]))
+            y = np.log(np.float64(p2[i]) / np.float64(p2[i - 1]))
+        else:
+            x = np.float64(p1[i]) / np.float64(p1[i - 1]) - 1.0
+            y = np.float64(p2[i]) / np.float64(p2[i - 1]) - 1.0
+        if np.isnan(x) or np.isnan(y):
+            continue
+        if first < 0:
+            first = i
+        last = i
+        count += 1
+        sx += x
+        sy += y
+        sxx += x * x
+        syy += y * y
+        sxy += x * y
+
+    if count < 2:
+        return np.nan, np.nan, count, first, last
+
+    covariance = (sxy - sx * sy / count) / (count - 1)
+    denominator = (count * sxx - sx * sx) * (count * syy - sy * sy)
+    if denominator <= 0.0:
+        return np.nan, covariance, count, first, last
+    correlation = (count * sxy - sx * sy) / np.sqrt(denominator)
+
+    return correlation, covariance, count, first, last
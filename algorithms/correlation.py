@@ -14,21 +14,22 @@ The main workflow is:
 1. Data Collection:
    - Uses yfinance library to fetch historical stock data
    - Takes two stock tickers and optional date range as input
-   - Retrieves adjusted closing prices for the specified stocks
+   - Retrieves adjusted closing prices for both stocks in a single download
 
 2. Date Processing:
-   - Handles both datetime and date objects
-   - Uses default 1-year lookback if dates not provided
-   - Converts datetime objects to date objects for consistency
+   - Works with whole dates (date objects)
+   - Uses default 1-year lookback, ending today (UTC), if dates not provided
 
 3. Correlation Analysis:
    - Aligns the price data for both stocks
-   - Calculates correlation coefficient and covariance
+   - Calculates correlation coefficient and covariance (closed-form, Numba)
    - Returns statistical metrics in a dictionary format
 
 The CorrelationCalculator class serves as a namespace containing static methods for:
 - Fetching individual stock data (fetch_stock_data)
+- Fetching several stocks in one request (fetch_stocks_data)
 - Calculating correlation metrics between pairs of stocks (calculate)
+- Calculating the correlation matrix of several stocks (calculate_matrix)
 ---------------- ---------------- ---------------- ---------------- ---------------- ----------------
 
 Performance Considerations
@@ -40,13 +41,29 @@ The code makes several optimizations:
     . combines operations to reduce intermediate steps
 
 - Efficient data alignment:
-    . makes use of a single pandas concat operation
-    . uses built-in pandas functions for calculations
+    . downloads both tickers in one request, already aligned by yfinance
+
+- Efficient calculations:
+    . returns are computed on contiguous NumPy arrays
+    . correlation and covariance come from a single closed-form pass
+    . the pass runs in a Numba-compiled kernel (algorithms/_kernels.py),
+      optionally built ahead of time (algorithms/_corr_aot.py)
 
 - Memory management:
     . drops unnecessary data early
     . uses the most appropriate data types
 
+- Caching:
+    . downloads are cached in-process per (tickers, start, end)
+    . entries expire after PRICE_CACHE_TTL seconds
+
+- Network:
+    . one keep-alive HTTP session is shared by all downloads
+    . one download at a time per process (yfinance isn't thread-safe);
+      waiting for it is bounded by DOWNLOAD_WAIT_TIMEOUT seconds
+    . downloads use a bounded number of threads, and Yahoo requests time out
+      after DOWNLOAD_TIMEOUT seconds
+
 
 
 Code Evolution Insights
@@ -75,8 +92,7 @@ Potential Improvements
 --------------------------------
 Some possible enhancements could include:
 
-- Caching mechanism for frequently accessed data
-- Parallel processing for multiple stock pairs
+- Shared (cross-process) cache for frequently accessed data
 - Data source abstraction layer
 - Results persistence
 - Visualization components
@@ -175,10 +191,147 @@ Best Practices Demonstrated
 
 
 import yfinance as yf  # will probably need to switch to a sturdier solution soon
+from yfinance import shared as yf_shared
 import pandas as pd
 import numpy as np
-from datetime import datetime, timedelta, date
-from typing import Dict, Any, Optional  # type hints
+import requests
+import threading
+import time
+from collections import OrderedDict
+from datetime import datetime, timedelta, timezone, date
+from typing import Dict, Any, List, Optional, Tuple  # type hints
+
+# prefer the ahead-of-time compiled kernel (built by algorithms/_corr_aot.py);
+# fall back to the JIT-compiled one when it hasn't been built
+# - the native build only takes contiguous float64 arrays
+try:
+    from algorithms.corr_native import pearson_returns
+except ImportError:
+    from algorithms._kernels import pearson_returns
+
+
+# how long a cached download stays fresh (in seconds);
+# 6h keeps intraday prices reasonably current
+PRICE_CACHE_TTL = 6 * 60 * 60
+
+# max number of cached downloads; least recently used ones are evicted first
+PRICE_CACHE_SIZE = 512
+
+
+# yfinance HTTP timeout (in seconds), per request to Yahoo;
+# a slow or rate-limited Yahoo fails fast instead of blocking the worker
+DOWNLOAD_TIMEOUT = 8.0
+
+# upper bound on waiting for another request's download to finish (in seconds);
+# past this the process is saturated, and the request fails fast
+DOWNLOAD_WAIT_TIMEOUT = 20.0
+
+# yfinance threads per download; pairs use none, larger batches at most this many
+DOWNLOAD_THREADS = 4
+
+
+class DownloadTimeoutError(TimeoutError):
+    """
+    Market data couldn't be fetched in time: Yahoo timed out, or the process
+    was too busy with other downloads. A server-side condition; worth a retry.
+    """
+
+
+# one yf.download at a time per process: yfinance keeps per-download state in
+# module globals (shared._DFS), so concurrent calls mix up each other's results
+# - every yf.download in the process must hold this lock
+_download_lock = threading.Lock()
+
+
+# shared HTTP session for yfinance;
+# keeps connections to Yahoo alive, so repeated downloads skip the TCP/TLS handshake
+_yf_session = requests.Session()
+
+
+# in-process cache for yfinance downloads
+# - keyed on (symbols, start, end); values are (fetched_at, prices)
+# - each entry expires PRICE_CACHE_TTL seconds after its own download,
+#   so entries don't all expire (and get re-downloaded) at the same moment
+# - failed downloads raise, so they are never cached
+PriceCacheKey = Tuple[Tuple[str, ...], date, date]
+_price_cache: "OrderedDict[PriceCacheKey, Tuple[float, pd.DataFrame]]" = OrderedDict()
+_price_cache_lock = threading.Lock()
+
+
+def _cached_prices(key: PriceCacheKey) -> Optional[pd.DataFrame]:
+    with _price_cache_lock:
+        entry = _price_cache.get(key)
+        if entry is None:
+            return None
+        fetched_at, prices = entry
+        if time.monotonic() - fetched_at > PRICE_CACHE_TTL:
+            del _price_cache[key]
+            return None
+        _price_cache.move_to_end(key)
+        return prices
+
+
+def _cache_prices(key: PriceCacheKey, prices: pd.DataFrame) -> None:
+    with _price_cache_lock:
+        _price_cache[key] = (time.monotonic(), prices)
+        _price_cache.move_to_end(key)
+        while len(_price_cache) > PRICE_CACHE_SIZE:
+            _price_cache.popitem(last=False)
+
+
+def _get_prices(
+    symbols: Tuple[str, ...], start_date: date, end_date: date
+) -> pd.DataFrame:
+    key = (symbols, start_date, end_date)
+    prices = _cached_prices(key)
+    if prices is not None:
+        return prices
+
+    # only the wait for the download slot is bounded here;
+    # the download itself is bounded by yfinance's HTTP timeout
+    if not _download_lock.acquire(timeout=DOWNLOAD_WAIT_TIMEOUT):
+        raise DownloadTimeoutError("Market data service busy - try again")
+    try:
+        # another request may have downloaded the same data while we waited
+        prices = _cached_prices(key)
+        if prices is None:
+            prices = _download_prices(symbols, start_date, end_date)
+            _cache_prices(key, prices)
+    finally:
+        _download_lock.release()
+    return prices
+
+
+def _download_prices(
+    symbols: Tuple[str, ...], start_date: date, end_date: date
+) -> pd.DataFrame:
+    # callers must hold _download_lock
+    data = yf.download(
+        list(symbols),
+        start=start_date,
+        end=end_date,
+        progress=False,
+        group_by="ticker",
+        threads=False if len(symbols) <= 2 else DOWNLOAD_THREADS,
+        auto_adjust=False,
+        session=_yf_session,
+        timeout=DOWNLOAD_TIMEOUT,
+    )
+
+    # yfinance records per-ticker failures instead of raising;
+    # a timed-out request to Yahoo is not the client's fault
+    if any(
+        "Timeout" in error or "timed out" in error
+        for error in yf_shared._ERRORS.values()
+    ):
+        raise DownloadTimeoutError("Market data request timed out - try again")
+
+    if data.empty:
+        raise ValueError(f"No data found for tickers {', '.join(symbols)}")
+
+    # group_by="ticker" yields (ticker, field) columns;
+    # flatten to one adjusted close column per ticker
+    return data.xs("Adj Close", axis=1, level=1)
 
 
 # merely a namespace for the static methods, a place to group them
@@ -198,26 +351,92 @@ class CorrelationCalculator:
 
         Uses Python type hinting.
         """
+        return CorrelationCalculator.fetch_stocks_data([ticker], start_date, end_date)[
+            ticker
+        ]
+
+    @staticmethod
+    def fetch_stocks_data(
+        tickers: List[str], start_date: datetime, end_date: datetime
+    ) -> pd.DataFrame:
+        """
+        Fetch adjusted closing prices for several tickers in a single download.
+
+        yfinance returns all symbols in one aligned multi-level DataFrame, so
+        a single round-trip replaces one HTTP request per ticker. Downloads are
+        cached in-process for PRICE_CACHE_TTL seconds.
+
+        Args:
+            tickers: Stock symbols to download
+            start_date: First date of the range
+            end_date: Last date of the range (exclusive)
+
+        Returns:
+            DataFrame with one adjusted close column per ticker, in the
+            order given, indexed by trading day
+
+        Raises:
+            ValueError: If the download fails or any ticker has no data
+        """
         try:
-            data = yf.download(ticker, start=start_date, end=end_date, progress=False)
-            if data.empty or "Adj Close" not in data.columns:
-                raise ValueError(f"No data found for ticker {ticker}")
-            return data["Adj Close"]
+            symbols = [ticker.upper() for ticker in tickers]
+
+            # normalize to date objects so equivalent requests share a cache entry
+            if isinstance(start_date, datetime):
+                start_date = start_date.date()
+            if isinstance(end_date, datetime):
+                end_date = end_date.date()
+
+            prices = _get_prices(tuple(symbols), start_date, end_date)
+
+            missing = [
+                ticker
+                for ticker, symbol in zip(tickers, symbols)
+                if symbol not in prices.columns or prices[symbol].isna().all()
+            ]
+            if missing:
+                raise ValueError(f"No data found for ticker(s) {', '.join(missing)}")
+
+            # select a copy, so the cached frame is never modified
+            prices = prices[symbols]
+            prices.columns = tickers
+            return prices
+        except DownloadTimeoutError:
+            raise
         except Exception as e:
-            raise ValueError(f"Error fetching data for {ticker}: {str(e)}")
+            raise ValueError(f"Error fetching data for {', '.join(tickers)}: {str(e)}")
+
+    @staticmethod
+    def resolve_dates(
+        start_date: Optional[date] = None, end_date: Optional[date] = None
+    ) -> Tuple[date, date]:
+        """
+        Resolve the requested date range, filling in the defaults.
+
+        Uses a default 1-year lookback ending today when dates are not provided.
+        "Today" is the UTC date, so every request within a UTC day resolves to
+        the same range (and the same cache entries), regardless of DST.
+        """
+        end_date = end_date or datetime.now(timezone.utc).date()
+        start_date = start_date or (end_date - timedelta(days=365))
+        return start_date, end_date
 
     @staticmethod
     def calculate(
         ticker1: str,
         ticker2: str,
-        start_date: Optional[datetime] = None,
-        end_date: Optional[datetime] = None,
+        start_date: Optional[date] = None,
+        end_date: Optional[date] = None,
+        log_returns: bool = False,
     ) -> Dict[str, Any]:
         """
         Calculate correlation and covariance between two stocks.
 
+        Simple daily returns are used by default; log_returns=True switches to
+        log returns, which give the same correlation to first order.
+
         Uses Python type hinting:
-            - Optional[datetime] indicates parameters can be None.
+            - Optional[date] indicates parameters can be None.
             - Dict[str, Any] specifies return type as dictionary with string keys and any value type
         """
         try:
@@ -225,67 +444,76 @@ class CorrelationCalculator:
             # --------------------------------
 
             # set default dates if not provided
-            end_date = end_date or datetime.now()
-            start_date = start_date or (end_date - timedelta(days=365))
-
-            # 2. Date Type Conversion
-            # --------------------------------
-
-            # convert datetime to date if necessary
-            start_date_val = (
-                start_date.date() if isinstance(start_date, datetime) else start_date
-            )
-            end_date_val = (
-                end_date.date() if isinstance(end_date, datetime) else end_date
+            start_date_val, end_date_val = CorrelationCalculator.resolve_dates(
+                start_date, end_date
             )
 
-            # 3. Data Fetching
+            # 2. Data Fetching & Alignment
             # --------------------------------
 
-            # fetch stock data
-            stock1_data = CorrelationCalculator.fetch_stock_data(
-                ticker1, start_date, end_date
-            )
-            stock2_data = CorrelationCalculator.fetch_stock_data(
-                ticker2, start_date, end_date
+            # a stock against itself only needs one series;
+            # correlation is 1 and covariance is the variance
+            same_ticker = ticker1.upper() == ticker2.upper()
+
+            # fetch both tickers in a single download;
+            # yfinance aligns them on the trading-day index
+            # whole dates are passed, so repeated "now" requests hit the cache
+            # correlation is symmetric, so the pair is fetched in canonical
+            # (sorted) order; (A, B) and (B, A) then share a cache entry
+            pair = sorted([ticker1, ticker2], key=str.upper)
+            combined_data = CorrelationCalculator.fetch_stocks_data(
+                [ticker1] if same_ticker else pair,
+                start_date_val,
+                end_date_val,
             )
 
-            # 4. Data Alignment
+            # 3. Compute Returns
             # --------------------------------
 
-            # create df with both series
-            # preserves index information
-            # handles missing dates automatically
-            combined_data = pd.concat([stock1_data, stock2_data], axis=1)
-            combined_data.columns = [ticker1, ticker2]
+            # all trading days in range, before missing prices are dropped
+            trading_days = len(combined_data)
 
-            # 5. Compute Returns
-            # --------------------------------
+            # work on the raw ndarray instead of an intermediate DataFrame;
+            # transposed, so each ticker's prices are a contiguous row
+            prices = combined_data.to_numpy(dtype=np.float64, copy=False).T
+
+            # drop days where either price is missing (one boolean mask);
+            # returns then span the gap, as with a forward fill
+            # the copy is skipped in the common case of no missing prices
+            dates = combined_data.index
+            valid = ~np.isnan(prices).any(axis=0)
+            if not valid.all():
+                prices = prices[:, valid]
+                dates = dates[valid]
 
-            # compute daily returns
-            returns = combined_data.pct_change()
-            returns = returns.dropna()  # remove any NaN values
+            # contiguous float64 price rows for the compiled kernel
+            prices1 = np.ascontiguousarray(prices[0])
+            prices2 = prices1 if same_ticker else np.ascontiguousarray(prices[1])
 
-            # 6. Correlation Calculation
+            # 4. Correlation Calculation
             # --------------------------------
 
+            # compute returns, correlation and covariance in one compiled pass;
+            # rows with NaN returns are skipped inside the kernel
+            correlation, covariance, n, first, last = pearson_returns(
+                prices1, prices2, log_returns
+            )
+
             # check for sufficient data points
-            if len(returns) < 2:
+            if n < 2:
                 raise ValueError("Insufficient data points for correlation calculation")
 
-            # compute correlation and covariance
-            # based on pandas built-in statistical functions
-            # handles missing values appropriately
-            correlation = returns[ticker1].corr(returns[ticker2])
-            covariance = returns[ticker1].cov(returns[ticker2])
-
             # validate results
-            if pd.isna(correlation) or pd.isna(covariance):
+            if not (np.isfinite(correlation) and np.isfinite(covariance)):
                 raise ValueError("Calculation resulted in NaN values")
 
+            # exact, rather than 1 up to rounding error
+            if same_ticker:
+                correlation = 1.0
+
             # get first and last dates from index
-            first_date = returns.index[0]
-            last_date = returns.index[-1]
+            first_date = dates[first].date()
+            last_date = dates[last].date()
 
             # dictionary comprehension
             return {
@@ -295,11 +523,96 @@ class CorrelationCalculator:
                 "end_date": end_date_val,
                 "ticker1": ticker1,
                 "ticker2": ticker2,
-                "data_points": len(returns),
-                "first_date": first_date.strftime("%Y-%m-%d"),
-                "last_date": last_date.strftime("%Y-%m-%d"),
-                "trading_days": len(combined_data),
+                "data_points": n,
+                "first_date": first_date,
+                "last_date": last_date,
+                "trading_days": trading_days,
+            }
+
+        except DownloadTimeoutError:
+            raise
+        except Exception as e:
+            raise ValueError(f"Calculation error: {str(e)}")
+
+    @staticmethod
+    def calculate_matrix(
+        tickers: List[str],
+        start_date: Optional[date] = None,
+        end_date: Optional[date] = None,
+        log_returns: bool = False,
+    ) -> Dict[str, Any]:
+        """
+        Calculate the pairwise correlation matrix for several stocks.
+
+        All tickers are fetched in one download and the matrix comes from a
+        single np.corrcoef call on the (days x tickers) returns, instead of
+        one calculate() call per pair.
+
+        Args:
+            tickers: Stock symbols, at least two and without duplicates
+            start_date: Optional start of the range (default: 1 year before end)
+            end_date: Optional end of the range (default: today)
+            log_returns: Use log returns instead of simple returns
+
+        Returns:
+            Dictionary with the tickers, the correlation matrix (rows and
+            columns in ticker order) and the same metadata as calculate()
+
+        Raises:
+            ValueError: If the data can't be fetched or is insufficient
+        """
+        try:
+            if len(tickers) < 2:
+                raise ValueError("At least two tickers are required")
+            if len({ticker.upper() for ticker in tickers}) != len(tickers):
+                raise ValueError("Tickers must be unique")
+
+            start_date_val, end_date_val = CorrelationCalculator.resolve_dates(
+                start_date, end_date
+            )
+
+            combined_data = CorrelationCalculator.fetch_stocks_data(
+                tickers, start_date_val, end_date_val
+            )
+            trading_days = len(combined_data)
+
+            # (days x tickers) price matrix; drop days with any missing price
+            prices = combined_data.to_numpy(dtype=np.float64, copy=False)
+            dates = combined_data.index
+            valid = ~np.isnan(prices).any(axis=1)
+            if not valid.all():
+                prices = prices[valid]
+                dates = dates[valid]
+
+            # one (days - 1) x tickers allocation; the rest happens in place
+            returns = np.divide(prices[1:], prices[:-1])
+            if log_returns:
+                np.log(returns, out=returns)
+            else:
+                returns -= 1.0
+
+            if returns.shape[0] < 2:
+                raise ValueError("Insufficient data points for correlation calculation")
+
+            # one BLAS-backed call for the whole matrix
+            with np.errstate(divide="ignore", invalid="ignore"):
+                matrix = np.corrcoef(returns, rowvar=False)
+
+            if not np.isfinite(matrix).all():
+                raise ValueError("Calculation resulted in NaN values")
+
+            return {
+                "tickers": tickers,
+                "correlation_matrix": np.round(matrix, 4).tolist(),
+                "start_date": start_date_val,
+                "end_date": end_date_val,
+                "data_points": returns.shape[0],
+                "first_date": dates[1].date(),
+                "last_date": dates[-1].date(),
+                "trading_days": trading_days,
             }
 
+        except DownloadTimeoutError:
+            raise
         except Exception as e:
             raise ValueError(f"Calculation error: {str(e)}")
@@ -5,3 +5,12 @@ class CorrelationAnalysisConfig(AppConfig):
     default_auto_field = "django.db.models.BigAutoField"
     name = "correlation_analysis"
     verbose_name = "Correlation Analysis"
+
+    def ready(self):
+        # compile the correlation kernel at startup,
+        # so the first request doesn't pay for the JIT compilation
+        # (a no-op when the ahead-of-time build is in use)
+        import numpy as np
+        from algorithms.correlation import pearson_returns
+
+        pearson_returns(np.ones(3), np.ones(3), False)
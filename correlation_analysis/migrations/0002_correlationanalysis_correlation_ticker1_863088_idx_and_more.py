@@ -0,0 +1,26 @@
+# Generated by Django 5.1.3 on 2026-10-15 17:49
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("correlation_analysis", "0001_initial"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="correlationanalysis",
+            index=models.Index(
+                fields=["ticker1", "ticker2", "-created_at"],
+                name="correlation_ticker1_863088_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="correlationanalysis",
+            index=models.Index(
+                fields=["-created_at"], name="correlation_created_05ba42_idx"
+            ),
+        ),
+    ]
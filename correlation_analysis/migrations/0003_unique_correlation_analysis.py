@@ -0,0 +1,50 @@
+# Generated by Django 5.1.3 on 2026-10-15 17:50
+
+from django.db import migrations, models
+
+
+def canonicalize_analyses(apps, schema_editor):
+    """
+    Store every analysis under its canonical (uppercase, sorted) ticker pair and
+    keep only the most recent analysis per pair and date range.
+    """
+    CorrelationAnalysis = apps.get_model("correlation_analysis", "CorrelationAnalysis")
+    seen = set()
+    for analysis in CorrelationAnalysis.objects.order_by("-created_at", "-id"):
+        ticker1, ticker2 = sorted((analysis.ticker1.upper(), analysis.ticker2.upper()))
+        key = (ticker1, ticker2, analysis.start_date, analysis.end_date)
+        if key in seen:
+            analysis.delete()
+            continue
+        seen.add(key)
+        if (ticker1, ticker2) != (analysis.ticker1, analysis.ticker2):
+            analysis.ticker1, analysis.ticker2 = ticker1, ticker2
+            analysis.save(update_fields=["ticker1", "ticker2"])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        (
+            "correlation_analysis",
+            "0002_correlationanalysis_correlation_ticker1_863088_idx_and_more",
+        ),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name="correlationanalysis",
+            name="created_at",
+            field=models.DateTimeField(
+                auto_now_add=True, help_text="When the analysis was (last) computed"
+            ),
+        ),
+        migrations.RunPython(canonicalize_analyses, migrations.RunPython.noop),
+        migrations.AddConstraint(
+            model_name="correlationanalysis",
+            constraint=models.UniqueConstraint(
+                fields=("ticker1", "ticker2", "start_date", "end_date"),
+                name="unique_correlation_analysis",
+            ),
+        ),
+    ]
@@ -16,12 +16,25 @@ class CorrelationAnalysis(models.Model):
     trading_days = models.IntegerField(
         help_text="Total number of trading days in range"
     )
-    created_at = models.DateTimeField(auto_now_add=True)
+    created_at = models.DateTimeField(
+        auto_now_add=True, help_text="When the analysis was (last) computed"
+    )
 
     class Meta:
         verbose_name = "Correlation Analysis"
         verbose_name_plural = "Correlation Analysis"
         ordering = ["-created_at"]
+        indexes = [
+            models.Index(fields=["ticker1", "ticker2", "-created_at"]),
+            models.Index(fields=["-created_at"]),
+        ]
+        constraints = [
+            # one analysis per (canonically ordered) pair and date range
+            models.UniqueConstraint(
+                fields=["ticker1", "ticker2", "start_date", "end_date"],
+                name="unique_correlation_analysis",
+            ),
+        ]
 
     def __str__(self):
         return f"Correlation Analysis: {self.ticker1} vs {self.ticker2} ({self.created_at.date()})"
@@ -1,10 +1,34 @@
+from django.core.validators import RegexValidator
 from rest_framework import serializers
 from .models import CorrelationAnalysis
 
 
+class TickerField(serializers.CharField):
+    """
+    Stock ticker symbol; normalized to uppercase, then checked against the
+    symbol format, so invalid input is rejected before any download.
+    """
+
+    default_validators = [
+        RegexValidator(r"^[A-Z0-9.\-^]{1,10}$", "Enter a valid ticker symbol.")
+    ]
+
+    def to_internal_value(self, data):
+        return super().to_internal_value(data).upper()
+
+
 class CorrelationAnalysisRequestSerializer(serializers.Serializer):
-    ticker1 = serializers.CharField(max_length=10)
-    ticker2 = serializers.CharField(max_length=10)
+    ticker1 = TickerField(max_length=10)
+    ticker2 = TickerField(max_length=10)
+    start_date = serializers.DateField(required=False)
+    end_date = serializers.DateField(required=False)
+
+
+class BatchCorrelationRequestSerializer(serializers.Serializer):
+    # a single yfinance download stays reliable up to ~20 symbols
+    tickers = serializers.ListField(
+        child=TickerField(max_length=10), min_length=2, max_length=20
+    )
     start_date = serializers.DateField(required=False)
     end_date = serializers.DateField(required=False)
 
@@ -1,5 +1,5 @@
 from django.urls import path
-from .views import CorrelationAnalysisView
+from .views import BatchCorrelationView, CorrelationAnalysisView
 
 app_name = "correlation_analysis"
 
@@ -9,4 +9,9 @@ urlpatterns = [
         CorrelationAnalysisView.as_view(),
         name="correlation-analysis",
     ),
+    path(
+        "batch-correlation/",
+        BatchCorrelationView.as_view(),
+        name="batch-correlation",
+    ),
 ]
@@ -1,13 +1,81 @@
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from datetime import timedelta
+
+import orjson
+from django.db import close_old_connections, transaction
+from django.http import HttpResponse
+from django.utils import timezone
 from rest_framework.views import APIView
 from rest_framework.response import Response
 from rest_framework import status
-from datetime import datetime
 from .serializers import (
+    BatchCorrelationRequestSerializer,
     CorrelationAnalysisRequestSerializer,
-    CorrelationAnalysisResponseSerializer,
 )
 from .models import CorrelationAnalysis
-from algorithms.correlation import CorrelationCalculator
+from algorithms.correlation import (
+    PRICE_CACHE_TTL,
+    CorrelationCalculator,
+    DownloadTimeoutError,
+)
+
+logger = logging.getLogger(__name__)
+
+# model field names; static, so computed once at import
+MODEL_FIELDS = frozenset(f.name for f in CorrelationAnalysis._meta.fields)
+
+# fields returned by the correlation endpoint, in response order
+RESPONSE_FIELDS = (
+    "correlation",
+    "covariance",
+    "start_date",
+    "end_date",
+    "ticker1",
+    "ticker2",
+    "data_points",
+    "first_date",
+    "last_date",
+    "trading_days",
+)
+
+# fields identifying an analysis (see the model's unique constraint)
+ANALYSIS_KEY_FIELDS = ("ticker1", "ticker2", "start_date", "end_date")
+
+# stored analyses are reused for as long as the underlying prices are cached
+ANALYSIS_MAX_AGE = timedelta(seconds=PRICE_CACHE_TTL)
+
+# background workers for persisting results,
+# so the response doesn't wait on the database write
+persistence_executor = ThreadPoolExecutor(
+    max_workers=4, thread_name_prefix="correlation-persist"
+)
+
+
+def save_analysis(fields):
+    """
+    Persist a correlation analysis; runs on a persistence_executor thread.
+
+    Each (ticker1, ticker2, start_date, end_date) is stored once; recomputing
+    an expired analysis updates the row and refreshes its created_at.
+    """
+    # the executor threads are long-lived; like a request, reuse this thread's
+    # connection unless it is broken or older than CONN_MAX_AGE
+    close_old_connections()
+    try:
+        lookup = {key: fields[key] for key in ANALYSIS_KEY_FIELDS}
+        defaults = {k: v for k, v in fields.items() if k not in lookup}
+        CorrelationAnalysis.objects.update_or_create(
+            **lookup, defaults={**defaults, "created_at": timezone.now()}
+        )
+    except Exception:
+        logger.exception(
+            "Failed to save correlation analysis %s vs %s",
+            fields.get("ticker1"),
+            fields.get("ticker2"),
+        )
+    finally:
+        close_old_connections()
 
 
 class CorrelationAnalysisView(APIView):
@@ -24,30 +92,105 @@ class CorrelationAnalysisView(APIView):
 
         try:
             validated_data = request_serializer.validated_data
-            result = CorrelationCalculator.calculate(
-                ticker1=validated_data["ticker1"],
-                ticker2=validated_data["ticker2"],
-                start_date=validated_data.get("start_date"),
-                end_date=validated_data.get("end_date"),
+            start_date, end_date = CorrelationCalculator.resolve_dates(
+                validated_data.get("start_date"), validated_data.get("end_date")
+            )
+
+            # correlation is symmetric; analyses are stored under the
+            # canonical (sorted) pair, the response keeps the requested order
+            requested = {
+                "ticker1": validated_data["ticker1"],
+                "ticker2": validated_data["ticker2"],
+            }
+            ticker1, ticker2 = sorted(requested.values())
+
+            # reuse a recent identical analysis instead of recomputing;
+            # an index seek on (ticker1, ticker2, ...)
+            existing = (
+                CorrelationAnalysis.objects.filter(
+                    ticker1=ticker1,
+                    ticker2=ticker2,
+                    start_date=start_date,
+                    end_date=end_date,
+                    created_at__gte=timezone.now() - ANALYSIS_MAX_AGE,
+                )
+                .order_by("-created_at")
+                .values(*RESPONSE_FIELDS)
+                .first()
             )
+            if existing is not None:
+                return HttpResponse(
+                    orjson.dumps({**existing, **requested}, default=str),
+                    content_type="application/json",
+                    status=status.HTTP_200_OK,
+                )
 
-            # convert string dates to datetime.date objects
-            result["first_date"] = datetime.strptime(
-                result["first_date"], "%Y-%m-%d"
-            ).date()
-            result["last_date"] = datetime.strptime(
-                result["last_date"], "%Y-%m-%d"
-            ).date()
+            result = CorrelationCalculator.calculate(
+                ticker1=ticker1,
+                ticker2=ticker2,
+                start_date=start_date,
+                end_date=end_date,
+            )
 
             # create model instance with only the fields that match our model
-            model_fields = [f.name for f in CorrelationAnalysis._meta.fields]
-            filtered_result = {k: v for k, v in result.items() if k in model_fields}
+            filtered_result = {k: v for k, v in result.items() if k in MODEL_FIELDS}
 
-            analysis = CorrelationAnalysis.objects.create(**filtered_result)
-            response_serializer = CorrelationAnalysisResponseSerializer(analysis)
+            # persist in the background, once any surrounding transaction commits
+            transaction.on_commit(
+                lambda: persistence_executor.submit(save_analysis, filtered_result)
+            )
 
-            return Response(response_serializer.data, status=status.HTTP_201_CREATED)
+            # respond straight from the computed values, serialized by orjson;
+            # skips the serializer and DRF's content negotiation/rendering
+            return HttpResponse(
+                orjson.dumps({**filtered_result, **requested}, default=str),
+                content_type="application/json",
+                status=status.HTTP_201_CREATED,
+            )
 
+        except DownloadTimeoutError as e:
+            return Response(
+                {"error": str(e)}, status=status.HTTP_503_SERVICE_UNAVAILABLE
+            )
+        except ValueError as e:
+            return Response({"error": str(e)}, status=status.HTTP_400_BAD_REQUEST)
+        except Exception as e:
+            return Response(
+                {"error": f"An unexpected error occurred: {str(e)}"},
+                status=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            )
+
+
+class BatchCorrelationView(APIView):
+    """
+    API View for computing the correlation matrix of several stocks.
+    """
+
+    def post(self, request):
+        request_serializer = BatchCorrelationRequestSerializer(data=request.data)
+        if not request_serializer.is_valid():
+            return Response(
+                request_serializer.errors, status=status.HTTP_400_BAD_REQUEST
+            )
+
+        try:
+            validated_data = request_serializer.validated_data
+            result = CorrelationCalculator.calculate_matrix(
+                tickers=validated_data["tickers"],
+                start_date=validated_data.get("start_date"),
+                end_date=validated_data.get("end_date"),
+            )
+
+            return HttpResponse(
+                orjson.dumps(result, default=str),
+                content_type="application/json",
+                status=status.HTTP_200_OK,
+            )
+
+        except DownloadTimeoutError as e:
+            return Response(
+                {"error": str(e)}, status=status.HTTP_503_SERVICE_UNAVAILABLE
+            )
         except ValueError as e:
             return Response({"error": str(e)}, status=status.HTTP_400_BAD_REQUEST)
         except Exception as e:
@@ -0,0 +1,15 @@
+# gunicorn.conf.py
+# picked up automatically when gunicorn is started from the project root:
+#   gunicorn quant_sandbox.wsgi:application
+
+# threaded workers
+# - yfinance downloads are serialized per process (algorithms/correlation.py),
+#   so a request that needs one queues behind the others in its worker
+# - the threads mainly serve cached and stored results in the meantime;
+#   download throughput scales with the number of workers (processes)
+worker_class = "gthread"
+threads = 4
+
+# a request waits up to 20s for the download slot, then the download itself
+# (Yahoo requests time out after 8s each); anything beyond this is a stuck worker
+timeout = 60